@@ -6,6 +6,7 @@ Afterwards it gets placed into the center of the EBD diagram.
 """
 
 import re
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import TextIO, Tuple, Union
@@ -16,6 +17,8 @@ from svgutils.compose import SVG, Figure  # type:ignore[import]
 # Sets the size of the watermark compared to the smaller dimension of the ebd diagram
 FINAL_SCALING_FACTOR = 0.8
 
+_UNITLESS_DIMENSION_PATTERN = re.compile(r"^[\d.]+$")  #: a dimension without a unit, e.g. '123' or '4.2'
+
 
 def convert_dimension_to_float(dimension: str) -> float:
     """
@@ -24,11 +27,11 @@ def convert_dimension_to_float(dimension: str) -> float:
     :param dimension: dimension string of a svg image
     """
 
-    if dimension[-2:] == "px":
+    if dimension.endswith("px"):
         dimension_float = float(dimension[:-2])
-    elif dimension[-2:] == "pt":
+    elif dimension.endswith("pt"):
         dimension_float = float(dimension[:-2]) * 4 / 3
-    elif re.match(r"^[\d.]+$", dimension) is not None:  # assume the default unit is px
+    elif _UNITLESS_DIMENSION_PATTERN.match(dimension) is not None:  # assume the default unit is px
         dimension_float = float(dimension)
     else:
         raise ValueError("unsupported unit type")
@@ -43,7 +46,14 @@ def get_dimensions_of_svg(svg_as_bytes: Union[BytesIO, TextIO]) -> Tuple[float,
     """
     # pylint: disable=no-member
     tree = etree.parse(svg_as_bytes)  # pylint:disable=c-extension-no-member
-    root = tree.getroot()
+    return _get_dimensions_of_svg_root(tree.getroot())
+
+
+def _get_dimensions_of_svg_root(root) -> Tuple[float, float]:
+    """
+    Extract the dimensions from an already parsed svg root element.
+    Allows callers which need the parsed tree anyway to avoid parsing the svg twice.
+    """
     # root.attrib["height"] gives a string like "123px"
     # for further usage, we have to remove the unit and convert it to integer
     width_of_svg_in_px = convert_dimension_to_float(root.attrib["width"])
@@ -52,16 +62,26 @@ def get_dimensions_of_svg(svg_as_bytes: Union[BytesIO, TextIO]) -> Tuple[float,
     return width_of_svg_in_px, height_of_svg_in_px
 
 
+@lru_cache(maxsize=None)
+def _get_dimensions_of_svg_file(path: Path) -> Tuple[float, float]:
+    """
+    Extract the dimensions of the svg file under the given path.
+    Cached because the Hochfrequenz logo never changes at runtime but is needed for every watermarked diagram.
+    """
+    with open(path, encoding="utf-8") as svg_file:
+        return get_dimensions_of_svg(svg_file)
+
+
 def add_background(svg: str) -> str:
     """
     Adds the (non-transparent) background to the svg code.
     The background color is set to be the "white" of the HF corporate design
     :param svg:
     """
-    ebd_width_in_px, ebd_height_in_px = get_dimensions_of_svg(BytesIO(svg.encode("utf-8")))
     background_color = "#f3f1f6"
     tree = etree.parse(BytesIO(svg.encode("utf-8")))  # pylint:disable=c-extension-no-member
     root = tree.getroot()
+    ebd_width_in_px, ebd_height_in_px = _get_dimensions_of_svg_root(root)
     xml_element = etree.Element(
         "polygon",
         attrib={
@@ -81,15 +101,14 @@ def add_watermark(ebd_svg: str) -> str:
     Scales our hochfrequenz logo and centers it in a given EBD diagram
     :param ebd_svg:
     """
-    ebd_svg_as_bytes = ebd_svg.encode("utf-8")
-    ebd_width_in_px, ebd_height_in_px = get_dimensions_of_svg(BytesIO(ebd_svg_as_bytes))
+    ebd_svg_root = etree.fromstring(ebd_svg.encode("utf-8"))
+    ebd_width_in_px, ebd_height_in_px = _get_dimensions_of_svg_root(ebd_svg_root)
 
     directory_path = Path(__file__).parent
     hochfrequenz_logo_file_name = "hochfrequenz-logo.svg"
     path_to_hf_logo = directory_path / hochfrequenz_logo_file_name
 
-    with open(path_to_hf_logo, encoding="utf-8") as watermark_svg:
-        watermark_width_in_px, watermark_height_in_px = get_dimensions_of_svg(watermark_svg)
+    watermark_width_in_px, watermark_height_in_px = _get_dimensions_of_svg_file(path_to_hf_logo)
 
     if ebd_height_in_px >= ebd_width_in_px:
         scale = (ebd_width_in_px * FINAL_SCALING_FACTOR) / watermark_width_in_px
@@ -104,7 +123,7 @@ def add_watermark(ebd_svg: str) -> str:
         ebd_width_in_px,
         ebd_height_in_px,
         SVG(str(path_to_hf_logo)).scale(scale).move(move_x, move_y),
-        etree.fromstring(ebd_svg_as_bytes),
+        ebd_svg_root,
     ).tostr()
 
     return ebd_with_watermark.decode("utf-8")
@@ -2,6 +2,7 @@
 This module contains logic to convert EbdTable data to EbdGraph data.
 """
 
+from sys import intern
 from typing import Dict, List, Optional
 
 from networkx import DiGraph  # type:ignore[import]
@@ -57,29 +58,30 @@ def get_all_nodes(table: EbdTable) -> List[EbdGraphNode]:
     Nodes may both be actual EBD check outcome codes (e.g. "A55") but also points where decisions are made.
     """
     result: List[EbdGraphNode] = [StartNode()]
-    contains_ende = False
     for row in table.rows:
-        decision_node = _convert_row_to_decision_node(row)
-        result.append(decision_node)
+        # collect the (few) nodes of one row in a small buffer and extend the result once per row
+        row_nodes: List[EbdGraphNode] = [_convert_row_to_decision_node(row)]
         for sub_row in row.sub_rows:
             outcome_node = _convert_sub_row_to_outcome_node(sub_row)
             if outcome_node is not None:
-                result.append(outcome_node)
-            if not contains_ende and sub_row.check_result.subsequent_step_number == "Ende":
-                contains_ende = True
-                result.append(EndNode())
+                row_nodes.append(outcome_node)
+        result.extend(row_nodes)
+    # the "Ende" detection is hoisted out of the build loop: any(...) short-circuits at the first hit instead of
+    # re-evaluating a flag per sub row; consumers look nodes up by key, so the EndNode's position doesn't matter
+    if any(sub_row.check_result.subsequent_step_number == "Ende" for row in table.rows for sub_row in row.sub_rows):
+        result.append(EndNode())
     return result
 
 
-def _get_key_and_node_with_lowest_step_number(ebd_table: EbdTable) -> tuple[str, EbdGraphNode]:
-    nodes: Dict[str, EbdGraphNode] = {node.get_key(): node for node in get_all_nodes(ebd_table)}
+def _get_key_and_node_with_lowest_step_number(nodes: Dict[str, EbdGraphNode]) -> tuple[str, EbdGraphNode]:
     first_node_after_start: EbdGraphNode
     if "1" in nodes:
         first_node_after_start = nodes["1"]
         return "1", first_node_after_start
     # not all tables have a "1" node, so we need to find the first numeric node; e.g. "10" for E_0401
-    lowest_numeric_key = min(int(key) for key in nodes.keys() if key.isnumeric())
-    return str(lowest_numeric_key), nodes[str(lowest_numeric_key)]
+    # min with key=int parses each step number exactly once and spares the int->str round trip afterwards
+    lowest_numeric_key = min((key for key in nodes if key.isnumeric()), key=int)
+    return lowest_numeric_key, nodes[lowest_numeric_key]
 
 
 def get_all_edges(table: EbdTable) -> List[EbdGraphEdge]:
@@ -88,13 +90,23 @@ def get_all_edges(table: EbdTable) -> List[EbdGraphEdge]:
     Edges connect decisions with outcomes or subsequent steps.
     """
     nodes: Dict[str, EbdGraphNode] = {node.get_key(): node for node in get_all_nodes(table)}
-    first_node_after_start = _get_key_and_node_with_lowest_step_number(table)[1]
+    return _get_all_edges(table, nodes)
+
+
+def _get_all_edges(table: EbdTable, nodes: Dict[str, EbdGraphNode]) -> List[EbdGraphEdge]:
+    """
+    The implementation of `get_all_edges`; it works on an already built key->node map, so that callers which
+    collected the nodes anyway (e.g. `convert_table_to_digraph`) don't trigger a second walk over the table.
+    """
+    first_node_after_start = _get_key_and_node_with_lowest_step_number(nodes)[1]
     result: List[EbdGraphEdge] = [EbdGraphEdge(source=nodes["Start"], target=first_node_after_start, note=None)]
 
     outcome_nodes_duplicates: dict[str, OutcomeNode] = {}  # map to check for duplicate outcome nodes
 
     for row in table.rows:
-        decision_node = _convert_row_to_decision_node(row)
+        # the decision node has been created in get_all_nodes already; reuse it instead of instantiating it again
+        decision_node = nodes[row.step_number]
+        assert isinstance(decision_node, DecisionNode)
         for sub_row in row.sub_rows:
             if sub_row.check_result.subsequent_step_number is not None:
                 edge = _yes_no_edge(
@@ -142,10 +154,16 @@ def convert_table_to_digraph(table: EbdTable) -> DiGraph:
     """
     converts an EbdTable into a directed graph (networkx)
     """
+    node_map: Dict[str, EbdGraphNode] = {node.get_key(): node for node in get_all_nodes(table)}
+    all_edges = _get_all_edges(table, node_map)
     result: DiGraph = DiGraph()
-    result.add_nodes_from([(node.get_key(), {"node": node}) for node in get_all_nodes(table)])
+    # generators instead of list comprehensions: no need to materialize the intermediate lists
+    # the keys are interned because the same few strings are used as dict keys all over the conversion and
+    # interned strings compare/hash by pointer in CPython
+    # get_key() has been evaluated once per node already when node_map was built; reuse those keys here
+    result.add_nodes_from((intern(key), {"node": node}) for key, node in node_map.items())
     result.add_edges_from(
-        [(edge.source.get_key(), edge.target.get_key(), {"edge": edge}) for edge in get_all_edges(table)]
+        (intern(edge.source.get_key()), intern(edge.target.get_key()), {"edge": edge}) for edge in all_edges
     )
     return result
 
@@ -157,10 +175,5 @@ def convert_table_to_graph(table: EbdTable) -> EbdGraph:
     if table is None:
         raise ValueError("table must not be None")
     graph = convert_table_to_digraph(table)
-    graph_metadata = EbdGraphMetaData(
-        ebd_code=table.metadata.ebd_code,
-        chapter=table.metadata.chapter,
-        sub_chapter=table.metadata.sub_chapter,
-        role=table.metadata.role,
-    )
+    graph_metadata = EbdGraphMetaData.from_table_metadata(table.metadata)
     return EbdGraph(metadata=graph_metadata, graph=graph, multi_step_instructions=table.multi_step_instructions)
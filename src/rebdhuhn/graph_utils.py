@@ -6,7 +6,7 @@ Some of these functions may store some information in the "attribute dictionarie
 
 from typing import List, Tuple
 
-from networkx import DiGraph, all_simple_paths  # type:ignore[import]
+from networkx import DiGraph, all_simple_paths, immediate_dominators, is_directed_acyclic_graph  # type:ignore[import]
 
 from rebdhuhn.models import ToNoEdge, ToYesEdge
 from rebdhuhn.models.errors import PathsNotGreaterThanOneError
@@ -14,6 +14,12 @@ from rebdhuhn.models.errors import PathsNotGreaterThanOneError
 COMMON_ANCESTOR_FIELD = "common_ancestor_for_node"
 # Defines the label to annotate the last common ancestor node with the information to which node
 
+YES_NO_EDGES_FIELD = "yes_no_edges"
+# Caches the (yes_edge, no_edge) tuple of a decision node so that repeated visits don't rescan its outgoing edges
+
+_ANCESTORS_MARKED_FIELD = "last_common_ancestors_are_marked"
+# Graph-level flag: set after _mark_last_common_ancestors ran so that a second renderer reuses the annotations
+
 
 def _find_last_common_ancestor(paths: List[List[str]]) -> str:
     """
@@ -25,8 +31,10 @@ def _find_last_common_ancestor(paths: List[List[str]]) -> str:
     paths = paths.copy()
     reference_path = paths.pop().copy()  # it's arbitrary which of the paths is the chosen one
     reference_path.pop()  # The last entry in a path is always the target node in which we are not interested
+    # sets allow for O(1) membership tests; testing `node in path` on the raw lists would rescan each path per node
+    path_sets = [set(path) for path in paths]
     for node in reversed(reference_path):
-        if all(node in path for path in paths):  # If node is present in all paths aka is a common ancestor node
+        if all(node in path for path in path_sets):  # If node is present in all paths aka is a common ancestor node
             return node
     raise ValueError("No common ancestor found.")
 
@@ -39,6 +47,38 @@ def _mark_last_common_ancestors(graph: DiGraph) -> None:
     path from the start node to the respective node.
     Each node which is such an ancestor will contain the information of which nodes it is the last common ancestor.
     It is stored in the dict field `COMMON_ANCESTOR_FIELD` as a list.
+
+    For acyclic graphs the last common ancestor of a node is exactly its immediate dominator (the last node that lies
+    on _every_ path from "Start" to the node), so it can be read from the dominator tree in (almost) linear time
+    instead of enumerating all simple paths (which can be exponential).
+    Graphs with loops are invalid EBDs anyway; for those we fall back to the path enumeration which raises the
+    well-known `PathsNotGreaterThanOneError`.
+
+    Marking is idempotent: if the same DiGraph is rendered both as plantuml and as dot, the second call returns
+    immediately instead of re-computing (and duplicating) the annotations.
+    """
+    if graph.graph.get(_ANCESTORS_MARKED_FIELD, False):
+        return
+    if not is_directed_acyclic_graph(graph):
+        _mark_last_common_ancestors_by_path_enumeration(graph)
+    else:
+        dominators = immediate_dominators(graph, "Start")
+        for node in graph:
+            in_degree: int = graph.in_degree(node)
+            if in_degree <= 1:
+                continue
+            if node not in dominators:  # i.e. the node is not reachable from "Start"
+                raise PathsNotGreaterThanOneError(node_key=node, indegree=in_degree, number_of_paths=0)
+            common_ancestor = dominators[node]
+            _annotate_common_ancestor(graph, common_ancestor, node)
+    # only set the flag after successful marking; a raising run should raise again when retried
+    graph.graph[_ANCESTORS_MARKED_FIELD] = True
+
+
+def _mark_last_common_ancestors_by_path_enumeration(graph: DiGraph) -> None:
+    """
+    The path enumeration based implementation of `_mark_last_common_ancestors`.
+    Only used for graphs that contain loops, where it raises a `PathsNotGreaterThanOneError` with helpful details.
     """
     for node in graph:
         in_degree: int = graph.in_degree(node)
@@ -52,19 +92,29 @@ def _mark_last_common_ancestors(graph: DiGraph) -> None:
                 number_of_paths=len(paths),
             )
         common_ancestor = _find_last_common_ancestor(paths)
-        assert common_ancestor != "Start", "Last common ancestor should always be at least the first decision node '1'."
-        # Annotate the common ancestor for later conversion
-        if COMMON_ANCESTOR_FIELD not in graph.nodes[common_ancestor]:
-            graph.nodes[common_ancestor][COMMON_ANCESTOR_FIELD] = [node]
-        else:
-            assert isinstance(graph.nodes[common_ancestor][COMMON_ANCESTOR_FIELD], list), "Wrong type"
-            graph.nodes[common_ancestor][COMMON_ANCESTOR_FIELD].append(node)
+        _annotate_common_ancestor(graph, common_ancestor, node)
+
+
+def _annotate_common_ancestor(graph: DiGraph, common_ancestor: str, node: str) -> None:
+    """
+    Annotate the common ancestor for later conversion.
+    """
+    assert common_ancestor != "Start", "Last common ancestor should always be at least the first decision node '1'."
+    if COMMON_ANCESTOR_FIELD not in graph.nodes[common_ancestor]:
+        graph.nodes[common_ancestor][COMMON_ANCESTOR_FIELD] = [node]
+    else:
+        assert isinstance(graph.nodes[common_ancestor][COMMON_ANCESTOR_FIELD], list), "Wrong type"
+        graph.nodes[common_ancestor][COMMON_ANCESTOR_FIELD].append(node)
 
 
 def _get_yes_no_edges(graph: DiGraph, node: str) -> Tuple[ToYesEdge, ToNoEdge]:
     """
     A shorthand to get the yes-edge and the no-edge of a decision node.
+    The result is cached in the attribute dict of the node because decision nodes may be visited more than once
+    during the conversion (e.g. when they're drawn below another node).
     """
+    if YES_NO_EDGES_FIELD in graph.nodes[node]:
+        return graph.nodes[node][YES_NO_EDGES_FIELD]
     yes_edge: ToYesEdge
     no_edge: ToNoEdge
     for edge in graph[node].values():
@@ -80,4 +130,5 @@ def _get_yes_no_edges(graph: DiGraph, node: str) -> Tuple[ToYesEdge, ToNoEdge]:
                 assert False, f"Unknown edge type: {edge}"
     assert "yes_edge" in locals(), f"No yes edge found for node {node}"
     assert "no_edge" in locals(), f"No no edge found for node {node}"
+    graph.nodes[node][YES_NO_EDGES_FIELD] = yes_edge, no_edge
     return yes_edge, no_edge
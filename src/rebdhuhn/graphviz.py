@@ -2,30 +2,51 @@
 This module contains logic to convert EbdGraph data to dot code (Graphviz) and further to parse this code to SVG images.
 """
 
+from functools import lru_cache
 from typing import List, Optional
-from xml.sax.saxutils import escape
 
 from rebdhuhn.add_watermark import add_background as add_background_function
 from rebdhuhn.add_watermark import add_watermark as add_watermark_function
 from rebdhuhn.graph_utils import _mark_last_common_ancestors
 from rebdhuhn.kroki import DotToSvgConverter, Kroki
-from rebdhuhn.models import DecisionNode, EbdGraph, EbdGraphEdge, EndNode, OutcomeNode, StartNode, ToNoEdge, ToYesEdge
+from rebdhuhn.models import (
+    DecisionNode,
+    EbdGraph,
+    EbdGraphEdge,
+    EbdGraphNode,
+    EndNode,
+    OutcomeNode,
+    StartNode,
+    ToNoEdge,
+    ToYesEdge,
+)
 
 ADD_INDENT = "    "  #: This is just for style purposes to make the plantuml files human-readable.
 
+_DOT_CODE_FIELD = "dot_code"
+# Graph-level cache field: the rendered dot code of a graph (the graph doesn't change between two renderings)
 
+# the constant attribute lists of the different node shapes; defined once instead of being re-interpolated per node
+_META_NODE_ATTRIBUTES = 'margin="0.2,0.12", shape=box, style=filled, fillcolor="#7a8da1"'  #: start and end nodes
+_OUTCOME_NODE_ATTRIBUTES = 'margin="0.17,0.08", shape=box, style=filled, fillcolor="#cfb986"'
+_DECISION_NODE_ATTRIBUTES = 'margin="0.2,0.12", shape=box, style="filled,rounded", fillcolor="#7aab8a"'
+
+_LABEL_TRANSLATION_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": '<BR align="left"/>'})
+# xml escaping and the newline replacement in one str.translate pass instead of four sequential str.replace passes
+
+
+@lru_cache(maxsize=1024)
 def _format_label(label: str) -> str:
     """
     Converts the given string e.g. a text for a node to a suitable output for dot. It replaces newlines (`\n`) with
-    the HTML-tag `<BR>`.
+    the HTML-tag `<BR>` and escapes `&`, `<` and `>`.
+    Cached because the same notes (e.g. 'Cluster: Ablehnung\n...') occur on many outcome nodes.
     """
-    return escape(label).replace("\n", '<BR align="left"/>')
-    # escaped_str = re.sub(r"^(\d+): ", r"<B>\1: </B>", label)
-    # escaped_str = label.replace("\n", '<BR align="left"/>')
-    # return f'<{escaped_str}<BR align="left"/>>'
+    return label.translate(_LABEL_TRANSLATION_TABLE)
 
 
-def _convert_start_node_to_dot(ebd_graph: EbdGraph, node: str, indent: str) -> str:
+def _convert_start_node_to_dot(ebd_graph: EbdGraph, node: str, node_object: EbdGraphNode, indent: str) -> str:
+    # pylint:disable=unused-argument
     """
     Convert a StartNode to dot code
     """
@@ -33,66 +54,62 @@ def _convert_start_node_to_dot(ebd_graph: EbdGraph, node: str, indent: str) -> s
         f'<B>{ebd_graph.metadata.ebd_code}</B><BR align="center"/>'
         f'<FONT point-size="12"><B><U>Prüfende Rolle:</U> {ebd_graph.metadata.role}</B></FONT><BR align="center"/>'
     )
-    return (
-        f'{indent}"{node}" '
-        f'[margin="0.2,0.12", shape=box, style=filled, fillcolor="#7a8da1", label=<{formatted_label}>];'
-    )
+    return f'{indent}"{node}" [{_META_NODE_ATTRIBUTES}, label=<{formatted_label}>];'
 
 
-def _convert_end_node_to_dot(node: str, indent: str) -> str:
+def _convert_end_node_to_dot(ebd_graph: EbdGraph, node: str, node_object: EbdGraphNode, indent: str) -> str:
+    # pylint:disable=unused-argument
     """
     Convert an EndNode to dot code
     """
-    return f'{indent}"{node}" [margin="0.2,0.12", shape=box, style=filled, fillcolor="#7a8da1", label="Ende"];'
+    return f'{indent}"{node}" [{_META_NODE_ATTRIBUTES}, label="Ende"];'
 
 
-def _convert_outcome_node_to_dot(ebd_graph: EbdGraph, node: str, indent: str) -> str:
+def _convert_outcome_node_to_dot(ebd_graph: EbdGraph, node: str, node_object: EbdGraphNode, indent: str) -> str:
+    # pylint:disable=unused-argument
     """
     Convert an OutcomeNode to dot code
     """
+    assert isinstance(node_object, OutcomeNode)
     formatted_label = (
-        f'<B>{ebd_graph.graph.nodes[node]["node"].result_code}</B><BR align="center"/>'
+        f'<B>{node_object.result_code}</B><BR align="center"/>'
         f'<FONT point-size="12">'
-        f'<U>Hinweis:</U><BR align="left"/>{_format_label(ebd_graph.graph.nodes[node]["node"].note)}<BR align="left"/>'
+        f'<U>Hinweis:</U><BR align="left"/>{_format_label(node_object.note)}<BR align="left"/>'
         f"</FONT>"
     )
-    return (
-        f'{indent}"{node}" '
-        f'[margin="0.17,0.08", shape=box, style=filled, fillcolor="#cfb986", label=<{formatted_label}>];'
-    )
+    return f'{indent}"{node}" [{_OUTCOME_NODE_ATTRIBUTES}, label=<{formatted_label}>];'
 
 
-def _convert_decision_node_to_dot(ebd_graph: EbdGraph, node: str, indent: str) -> str:
+def _convert_decision_node_to_dot(ebd_graph: EbdGraph, node: str, node_object: EbdGraphNode, indent: str) -> str:
+    # pylint:disable=unused-argument
     """
     Convert a DecisionNode to dot code
     """
+    assert isinstance(node_object, DecisionNode)
     formatted_label = (
-        f'<B>{ebd_graph.graph.nodes[node]["node"].step_number}: </B>'
-        f'{_format_label(ebd_graph.graph.nodes[node]["node"].question)}'
-        f'<BR align="left"/>'
-    )
-    return (
-        f'{indent}"{node}" [margin="0.2,0.12", shape=box, style="filled,rounded", fillcolor="#7aab8a", '
-        f"label=<{formatted_label}>];"
+        f"<B>{node_object.step_number}: </B>" f"{_format_label(node_object.question)}" f'<BR align="left"/>'
     )
+    return f'{indent}"{node}" [{_DECISION_NODE_ATTRIBUTES}, label=<{formatted_label}>];'
 
 
-def _convert_node_to_dot(ebd_graph: EbdGraph, node: str, indent: str) -> str:
+_NODE_TYPE_TO_DOT_CONVERTER = {
+    DecisionNode: _convert_decision_node_to_dot,
+    OutcomeNode: _convert_outcome_node_to_dot,
+    EndNode: _convert_end_node_to_dot,
+    StartNode: _convert_start_node_to_dot,
+}  #: maps a node type to its converter function; a dict lookup is cheaper than cascading isinstance checks
+
+
+def _convert_node_to_dot(ebd_graph: EbdGraph, node: str, node_object: EbdGraphNode, indent: str) -> str:
     """
     A shorthand to convert an arbitrary node to dot code. It just determines the node type and calls the
     respective function.
     """
-    match ebd_graph.graph.nodes[node]["node"]:
-        case DecisionNode():
-            return _convert_decision_node_to_dot(ebd_graph, node, indent)
-        case OutcomeNode():
-            return _convert_outcome_node_to_dot(ebd_graph, node, indent)
-        case EndNode():
-            return _convert_end_node_to_dot(node, indent)
-        case StartNode():
-            return _convert_start_node_to_dot(ebd_graph, node, indent)
-        case _:
-            raise ValueError(f"Unknown node type: {ebd_graph.graph.nodes[node]['node']}")
+    try:
+        converter = _NODE_TYPE_TO_DOT_CONVERTER[type(node_object)]
+    except KeyError as key_error:
+        raise ValueError(f"Unknown node type: {node_object}") from key_error
+    return converter(ebd_graph, node, node_object, indent)
 
 
 def _convert_nodes_to_dot(ebd_graph: EbdGraph, indent: str) -> str:
@@ -103,7 +120,13 @@ def _convert_nodes_to_dot(ebd_graph: EbdGraph, indent: str) -> str:
         # pylint: disable=fixme
         # TODO: Implement multi step instruction text to a graphical representation
         pass
-    return "\n".join([_convert_node_to_dot(ebd_graph, node, indent) for node in ebd_graph.graph.nodes])
+    # nodes(data="node") resolves each node payload once instead of going through NodeView.__getitem__ per node
+    return "\n".join(
+        [
+            _convert_node_to_dot(ebd_graph, node, node_object, indent)
+            for node, node_object in ebd_graph.graph.nodes(data="node")
+        ]
+    )
 
 
 def _convert_yes_edge_to_dot(node_src: str, node_target: str, indent: str) -> str:
@@ -127,45 +150,64 @@ def _convert_ebd_graph_edge_to_dot(node_src: str, node_target: str, indent: str)
     return f'{indent}"{node_src}" -> "{node_target}";'
 
 
-def _convert_edge_to_dot(ebd_graph: EbdGraph, node_src: str, node_target: str, indent: str) -> str:
+_EDGE_TYPE_TO_DOT_CONVERTER = {
+    ToYesEdge: _convert_yes_edge_to_dot,
+    ToNoEdge: _convert_no_edge_to_dot,
+    EbdGraphEdge: _convert_ebd_graph_edge_to_dot,
+}  #: maps an edge type to its converter function
+
+
+def _convert_edge_to_dot(edge: EbdGraphEdge, node_src: str, node_target: str, indent: str) -> str:
     """
     A shorthand to convert an arbitrary node to dot code. It just determines the node type and calls the
     respective function.
     """
-    match ebd_graph.graph[node_src][node_target]["edge"]:
-        case ToYesEdge():
-            return _convert_yes_edge_to_dot(node_src, node_target, indent)
-        case ToNoEdge():
-            return _convert_no_edge_to_dot(node_src, node_target, indent)
-        case EbdGraphEdge():
-            return _convert_ebd_graph_edge_to_dot(node_src, node_target, indent)
-        case _:
-            raise ValueError(f"Unknown edge type: {ebd_graph.graph[node_src][node_target]['edge']}")
+    try:
+        converter = _EDGE_TYPE_TO_DOT_CONVERTER[type(edge)]
+    except KeyError as key_error:
+        raise ValueError(f"Unknown edge type: {edge}") from key_error
+    return converter(node_src, node_target, indent)
 
 
 def _convert_edges_to_dot(ebd_graph: EbdGraph, indent: str) -> List[str]:
     """
     Convert all edges of the EbdGraph to dot output and return it as a string.
     """
-    return [_convert_edge_to_dot(ebd_graph, edge[0], edge[1], indent) for edge in ebd_graph.graph.edges]
+    # edges(data="edge") resolves each edge payload once instead of two AtlasView lookups per edge
+    return [
+        _convert_edge_to_dot(edge, node_src, node_target, indent)
+        for node_src, node_target, edge in ebd_graph.graph.edges(data="edge")
+    ]
 
 
 def convert_graph_to_dot(ebd_graph: EbdGraph) -> str:
     """
     Convert the EbdGraph to dot output for Graphviz. Returns the dot code as string.
+    The result is cached in the graph-level attribute dict, so rendering the same graph twice
+    (e.g. once with and once without watermark) doesn't regenerate the dot code.
     """
     nx_graph = ebd_graph.graph
+    if _DOT_CODE_FIELD in nx_graph.graph:
+        return nx_graph.graph[_DOT_CODE_FIELD]
     _mark_last_common_ancestors(nx_graph)
     header = (
         f'<B><FONT POINT-SIZE="18">{ebd_graph.metadata.chapter}</FONT></B><BR/><BR/>'
         f'<B><FONT POINT-SIZE="16">{ebd_graph.metadata.sub_chapter}</FONT></B><BR/><BR/><BR/><BR/>'
     )
-    dot_code = "digraph D {\n" f'{ADD_INDENT}labelloc="t";\n{ADD_INDENT}label=<{header}>;\n'
     assert len(nx_graph["Start"]) == 1, "Start node must have exactly one outgoing edge."
-    dot_code += _convert_nodes_to_dot(ebd_graph, ADD_INDENT) + "\n\n"
-    dot_code += "\n".join(_convert_edges_to_dot(ebd_graph, ADD_INDENT)) + "\n"
-    dot_code += '\n    bgcolor="transparent";\n'
-    return dot_code + "}"
+    # collect the parts in a list and join them once; += on the growing dot_code string would copy it repeatedly
+    dot_code_parts = [
+        "digraph D {\n" f'{ADD_INDENT}labelloc="t";\n{ADD_INDENT}label=<{header}>;\n',
+        _convert_nodes_to_dot(ebd_graph, ADD_INDENT),
+        "\n\n",
+        "\n".join(_convert_edges_to_dot(ebd_graph, ADD_INDENT)),
+        "\n",
+        '\n    bgcolor="transparent";\n',
+        "}",
+    ]
+    dot_code = "".join(dot_code_parts)
+    nx_graph.graph[_DOT_CODE_FIELD] = dot_code
+    return dot_code
 
 
 def convert_dot_to_svg_kroki(
@@ -5,6 +5,7 @@ we use kroki.io (hosted via docker at http://localhost:8125/) to convert dot cod
 from typing import Protocol
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 
 # pylint:disable=too-few-public-methods
@@ -43,16 +44,31 @@ class Kroki:
         if not kroki_host:
             raise ValueError("kroki_host must be provided")
         self._host = kroki_host
+        # one session for all requests of this instance: the TCP connection to the kroki host is kept alive
+        # instead of being re-established per diagram; transient server hiccups are retried with backoff
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["POST"],
+                # hand the last response back after exhausted retries so callers still get the descriptive ValueError
+                raise_on_status=False,
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def convert_dot_to_svg(self, dot_code: str) -> str:
         """
         returns the svg code as str
         """
         url = self._host
-        answer = requests.post(
+        answer = self._session.post(
             url,
             json={"diagram_source": dot_code, "diagram_type": "graphviz", "output_format": "svg"},
-            timeout=5,
+            timeout=(5, 30),  # (connect, read): rendering large diagrams may take far longer than the TCP connect
         )
         if answer.status_code != 200:
             raise ValueError(
@@ -66,10 +82,10 @@ class Kroki:
         returns the svg code as str
         """
         url = self._host
-        answer = requests.post(
+        answer = self._session.post(
             url,
             json={"diagram_source": plantuml_code, "diagram_type": "plantuml", "output_format": "svg"},
-            timeout=5,
+            timeout=(5, 30),  # (connect, read): rendering large diagrams may take far longer than the TCP connect
         )
         if answer.status_code != 200:
             raise ValueError(
@@ -9,10 +9,10 @@ import attrs
 from networkx import DiGraph  # type:ignore[import]
 
 # pylint:disable=too-few-public-methods
-from rebdhuhn.models.ebd_table import RESULT_CODE_REGEX, MultiStepInstruction
+from rebdhuhn.models.ebd_table import EbdTableMetaData, MultiStepInstruction, _validate_step_number
 
 
-@attrs.define(auto_attribs=True, kw_only=True)
+@attrs.define(auto_attribs=True, kw_only=True, slots=True)
 class EbdGraphMetaData:
     """
     Metadata of an EBD graph
@@ -40,6 +40,19 @@ class EbdGraphMetaData:
     e.g. 'BIKO' for "Prüfende Rolle: 'BIKO'"
     """
 
+    @classmethod
+    def from_table_metadata(cls, metadata: EbdTableMetaData) -> "EbdGraphMetaData":
+        """
+        Creates the graph metadata from the table metadata.
+        No strings are copied here: the instances only share references to the same (immutable) values.
+        """
+        return cls(
+            ebd_code=metadata.ebd_code,
+            chapter=metadata.chapter,
+            sub_chapter=metadata.sub_chapter,
+            role=metadata.role,
+        )
+
 
 class EbdGraphNode(ABC):
     """
@@ -59,14 +72,14 @@ class EbdGraphNode(ABC):
         return self.get_key()
 
 
-@attrs.define(auto_attribs=True, kw_only=True, frozen=True)
+@attrs.define(auto_attribs=True, kw_only=True, frozen=True, slots=True, cache_hash=True)
 class DecisionNode(EbdGraphNode):  # networkx requirement: nodes are hashable (frozen=True)
     """
     A decision node is a question that can be answered with "ja" or "nein"
     (e.g. "Erfolgt die Bestellung zum Monatsersten 00:00 Uhr?")
     """
 
-    step_number: str = attrs.field(validator=attrs.validators.matches_re(r"\d+\*?"))
+    step_number: str = attrs.field(validator=_validate_step_number)
     """
     number of the Prüfschritt, e.g. '1', '2' or '6*'
     """
@@ -80,18 +93,19 @@ class DecisionNode(EbdGraphNode):  # networkx requirement: nodes are hashable (f
         return self.step_number
 
 
-@attrs.define(auto_attribs=True, kw_only=True, frozen=True)  # networkx requirement: nodes are hashable (frozen=True)
+# networkx requirement: nodes are hashable (frozen=True)
+@attrs.define(auto_attribs=True, kw_only=True, frozen=True, slots=True, cache_hash=True)
 class OutcomeNode(EbdGraphNode):
     """
     An outcome node is a leaf of the Entscheidungsbaum tree. It has no subsequent steps.
     """
 
-    result_code: str = attrs.field(validator=attrs.validators.matches_re(RESULT_CODE_REGEX))
+    result_code: str = attrs.field()
     """
     The outcome of the decision tree check; e.g. 'A55'
     """
 
-    note: Optional[str] = attrs.field(validator=attrs.validators.optional(attrs.validators.instance_of(str)))
+    note: Optional[str] = attrs.field()
     """
     An optional note for this outcome; e.g. 'Cluster:Ablehnung\nFristüberschreitung'
     """
@@ -100,7 +114,8 @@ class OutcomeNode(EbdGraphNode):
         return self.result_code
 
 
-@attrs.define(auto_attribs=True, kw_only=True, frozen=True)  # networkx requirement: nodes are hashable (frozen=True)
+# networkx requirement: nodes are hashable (frozen=True)
+@attrs.define(auto_attribs=True, kw_only=True, frozen=True, slots=True, cache_hash=True)
 class EndNode(EbdGraphNode):
     """
     There is only one end node per graph. It is the "exit" of the decision tree.
@@ -110,7 +125,8 @@ class EndNode(EbdGraphNode):
         return "Ende"
 
 
-@attrs.define(auto_attribs=True, kw_only=True, frozen=True)  # networkx requirement: nodes are hashable (frozen=True)
+# networkx requirement: nodes are hashable (frozen=True)
+@attrs.define(auto_attribs=True, kw_only=True, frozen=True, slots=True, cache_hash=True)
 class StartNode(EbdGraphNode):
     """
     There is only one starting node per graph; e.g. 'E0401'. This starting node is always connected to a very first
@@ -122,7 +138,7 @@ class StartNode(EbdGraphNode):
         return "Start"
 
 
-@attrs.define(auto_attribs=True, kw_only=True)
+@attrs.define(auto_attribs=True, kw_only=True, slots=True)
 class EbdGraphEdge:
     """
     base class of all edges in an EBD Graph
@@ -144,7 +160,7 @@ class EbdGraphEdge:
     """
 
 
-@attrs.define(auto_attribs=True, kw_only=True)
+@attrs.define(auto_attribs=True, kw_only=True, slots=True)
 class ToYesEdge(EbdGraphEdge):
     """
     an edge that connects a DecisionNode with the positive next step
@@ -156,7 +172,7 @@ class ToYesEdge(EbdGraphEdge):
     """
 
 
-@attrs.define(auto_attribs=True, kw_only=True)
+@attrs.define(auto_attribs=True, kw_only=True, slots=True)
 class ToNoEdge(EbdGraphEdge):
     """
     an edge that connects a DecisionNode with the negative next step
@@ -168,7 +184,7 @@ class ToNoEdge(EbdGraphEdge):
     """
 
 
-@attrs.define(auto_attribs=True, kw_only=True)
+@attrs.define(auto_attribs=True, kw_only=True, slots=True)
 class EbdGraph:
     """
     EbdGraph is the structured representation of an Entscheidungsbaumdiagramm
@@ -3,6 +3,8 @@ This module contains logic to convert EbdGraph data to plantuml code and further
 """
 
 from collections import namedtuple
+from functools import lru_cache
+from typing import Callable, Dict
 
 from networkx import DiGraph  # type:ignore[import]
 
@@ -13,6 +15,42 @@ from rebdhuhn.models.errors import GraphTooComplexForPlantumlError, NotExactlyTw
 
 ADD_INDENT = "    "  #: This is just for style purposes to make the plantuml files human-readable.
 
+_PLANTUML_CODE_FIELD = "plantuml_code"
+# Graph-level cache field: the rendered plantuml code of a graph (the graph doesn't change between two renderings)
+
+_PLANTUML_PREAMBLE = (
+    "@startuml\n"
+    "skinparam Shadowing false\n"
+    "skinparam NoteBorderColor #f3f1f6\n"
+    "skinparam NoteBackgroundColor #f3f1f6\n"
+    "skinparam NoteFontSize 12\n"
+    "skinparam ActivityBorderColor none\n"
+    "skinparam ActivityBackgroundColor #7a8da1\n"
+    "skinparam ActivityFontSize 16\n"
+    "skinparam ArrowColor #7aab8a\n"
+    "skinparam ArrowFontSize 16\n"
+    "skinparam ActivityDiamondBackgroundColor #7aab8a\n"
+    "skinparam ActivityDiamondBorderColor #7aab8a\n"
+    "skinparam ActivityDiamondFontSize 18\n"
+    "skinparam defaultFontName DejaVu Serif Condensed\n"
+    "skinparam ActivityEndColor #669580\n"
+    "\n"
+    "header\n"
+    "<b>FV2210\n"
+    "2022-12-12\n"
+    "endheader\n"
+    "\n"
+)  #: the static part of every plantuml file; only the title/metadata below it differs between graphs
+
+
+@lru_cache(maxsize=None)
+def _indent_deeper(indent: str) -> str:
+    """
+    Returns the given indentation increased by one level.
+    Memoized because during the recursive conversion the same few indentation strings are derived over and over.
+    """
+    return indent + ADD_INDENT
+
 
 def _escape_for_plantuml(input_str: str) -> str:
     """
@@ -55,8 +93,8 @@ def _convert_outcome_node_to_plantuml(graph: DiGraph, node: str, indent: str) ->
 
     result = f"{indent}:{outcome_node.result_code};\n"
     if outcome_node.note is not None:
-        note = outcome_node.note.replace("\n", f"\n{indent}{ADD_INDENT}")
-        result += f"{indent}note left\n" f"{indent}{ADD_INDENT}{_escape_for_plantuml(note)}\n" f"{indent}endnote\n"
+        note = outcome_node.note.replace("\n", f"\n{_indent_deeper(indent)}")
+        result += f"{indent}note left\n" f"{_indent_deeper(indent)}{_escape_for_plantuml(note)}\n" f"{indent}endnote\n"
     return f"{result}{indent}kill;\n"
 
 
@@ -80,8 +118,9 @@ def _convert_decision_node_to_plantuml(graph: DiGraph, node: str, indent: str) -
             [str(x) for x in graph[node].values()],
         )
     yes_edge, no_edge = _get_yes_no_edges(graph, node)
-    yes_node = str(yes_edge.target)
-    no_node = str(no_edge.target)
+    # get_key() directly instead of str(...): same result, but without the __str__ indirection
+    yes_node = yes_edge.target.get_key()
+    no_node = no_edge.target.get_key()
 
     Cases = namedtuple("Cases", "yes_below_no no_below_yes common_ancestor")
     cases = Cases(
@@ -91,33 +130,42 @@ def _convert_decision_node_to_plantuml(graph: DiGraph, node: str, indent: str) -
     )
     assert cases.count(True) <= 1, "This cannot actually fail."
 
-    result = (
+    # collect the parts in a list and join them once at the end; repeated += on a str would copy the
+    # ever-growing result on each concatenation
+    parts = [
         f"{indent}if (<b>{decision_node.step_number}: </b> {_escape_for_plantuml(decision_node.question)}) then (ja)\n"
-    )
+    ]
     if not cases.yes_below_no and not graph.in_degree(yes_node) > 1:
         # Draw the following node here only if it shouldn't be drawn under the no-branch and if it isn't a node with
         # indegree > 1.
-        result += _convert_node_to_plantuml(graph, yes_node, indent + ADD_INDENT)
-    result += f"{indent}else (nein)\n"
+        parts.append(_convert_node_to_plantuml(graph, yes_node, _indent_deeper(indent)))
+    parts.append(f"{indent}else (nein)\n")
     if not cases.no_below_yes and not graph.in_degree(no_node) > 1:
         # Draw the following node here only if it shouldn't be drawn under the yes-branch and if it isn't a node with
         # indegree > 1.
-        result += _convert_node_to_plantuml(graph, no_node, indent + ADD_INDENT)
-    result += f"{indent}endif\n"
+        parts.append(_convert_node_to_plantuml(graph, no_node, _indent_deeper(indent)))
+    parts.append(f"{indent}endif\n")
 
     # Appendix part
     if cases.yes_below_no:
-        result += _convert_decision_node_to_plantuml(graph, yes_node, indent)
+        parts.append(_convert_decision_node_to_plantuml(graph, yes_node, indent))
     elif cases.no_below_yes:
-        result += _convert_decision_node_to_plantuml(graph, no_node, indent)
+        parts.append(_convert_decision_node_to_plantuml(graph, no_node, indent))
     elif cases.common_ancestor:
         if len(graph.nodes[node][COMMON_ANCESTOR_FIELD]) != 1:
             # This is not supported by the plantuml converter. However, if you remove this raise statement, the
             # converter may work even may produce valid puml. The last time I tried this resulted in copied regions
             # inside the graph. So, really complex graphs would get insanely big.
             raise GraphTooComplexForPlantumlError
-        result += _convert_node_to_plantuml(graph, graph.nodes[node][COMMON_ANCESTOR_FIELD][0], indent)
-    return result
+        parts.append(_convert_node_to_plantuml(graph, graph.nodes[node][COMMON_ANCESTOR_FIELD][0], indent))
+    return "".join(parts)
+
+
+_NODE_TYPE_TO_PLANTUML_CONVERTER: Dict[type, Callable[[DiGraph, str, str], str]] = {
+    DecisionNode: _convert_decision_node_to_plantuml,
+    OutcomeNode: _convert_outcome_node_to_plantuml,
+    EndNode: _convert_end_node_to_plantuml,
+}  #: maps a node type to its converter function; a dict lookup is cheaper than cascading isinstance checks
 
 
 def _convert_node_to_plantuml(graph: DiGraph, node: str, indent: str) -> str:
@@ -125,45 +173,25 @@ def _convert_node_to_plantuml(graph: DiGraph, node: str, indent: str) -> str:
     A shorthand to convert an arbitrary node to plantuml code. It just determines the node type and calls the
     respective function.
     """
-    match graph.nodes[node]["node"]:
-        case DecisionNode():
-            return _convert_decision_node_to_plantuml(graph, node, indent)
-        case OutcomeNode():
-            return _convert_outcome_node_to_plantuml(graph, node, indent)
-        case EndNode():
-            return _convert_end_node_to_plantuml(graph, node, indent)
-        case _:
-            raise ValueError(f"Unknown node type: {graph[node]['node']}")
+    try:
+        converter = _NODE_TYPE_TO_PLANTUML_CONVERTER[type(graph.nodes[node]["node"])]
+    except KeyError as key_error:
+        raise ValueError(f"Unknown node type: {graph.nodes[node]['node']}") from key_error
+    return converter(graph, node, indent)
 
 
 def convert_graph_to_plantuml(graph: EbdGraph) -> str:
     """
     Converts given graph to plantuml code and returns it as a string.
+    The result is cached in the graph-level attribute dict, so rendering the same graph twice doesn't regenerate
+    the plantuml code.
     """
     nx_graph = graph.graph
+    if _PLANTUML_CODE_FIELD in nx_graph.graph:
+        return nx_graph.graph[_PLANTUML_CODE_FIELD]
     _mark_last_common_ancestors(nx_graph)
     plantuml_code: str = (
-        "@startuml\n"
-        "skinparam Shadowing false\n"
-        "skinparam NoteBorderColor #f3f1f6\n"
-        "skinparam NoteBackgroundColor #f3f1f6\n"
-        "skinparam NoteFontSize 12\n"
-        "skinparam ActivityBorderColor none\n"
-        "skinparam ActivityBackgroundColor #7a8da1\n"
-        "skinparam ActivityFontSize 16\n"
-        "skinparam ArrowColor #7aab8a\n"
-        "skinparam ArrowFontSize 16\n"
-        "skinparam ActivityDiamondBackgroundColor #7aab8a\n"
-        "skinparam ActivityDiamondBorderColor #7aab8a\n"
-        "skinparam ActivityDiamondFontSize 18\n"
-        "skinparam defaultFontName DejaVu Serif Condensed\n"
-        "skinparam ActivityEndColor #669580\n"
-        "\n"
-        "header\n"
-        "<b>FV2210\n"
-        "2022-12-12\n"
-        "endheader\n"
-        "\n"
+        f"{_PLANTUML_PREAMBLE}"
         "title\n"
         f"{graph.metadata.chapter}\n"
         "\n"
@@ -184,9 +212,9 @@ def convert_graph_to_plantuml(graph: EbdGraph) -> str:
         key_of_first_node = "1"
     else:
         key_of_first_node = list(nx_graph["Start"].keys())[0]
-    plantuml_code += _convert_node_to_plantuml(nx_graph, key_of_first_node, "")
-
-    return plantuml_code + "\n@enduml\n"
+    result = "".join((plantuml_code, _convert_node_to_plantuml(nx_graph, key_of_first_node, ""), "\n@enduml\n"))
+    nx_graph.graph[_PLANTUML_CODE_FIELD] = result
+    return result
 
 
 def convert_plantuml_to_svg_kroki(plantuml_code: str, converter: PlantUmlToSvgConverter | None = None) -> str:
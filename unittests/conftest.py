@@ -0,0 +1,36 @@
+"""
+Shared test helpers, e.g. to detect whether the local kroki instance (see docker-compose.yaml) is up and running.
+"""
+
+import socket
+from functools import lru_cache
+from pathlib import Path
+
+KROKI_HOST = "localhost"  #: host of the local kroki docker container
+KROKI_PORT = 8125  #: port of the local kroki docker container
+
+_TEST_FILES_DIR = Path(__file__).parent / "test_files"
+
+
+@lru_cache(maxsize=None)
+def read_kroki_response_mock(file_name: str) -> str:
+    """
+    Returns the content of the given kroki response mock file from unittests/test_files.
+    Cached because the same response file (e.g. for E_0003) is used by several tests.
+    """
+    with open(_TEST_FILES_DIR / file_name, "r", encoding="utf-8") as infile:
+        return infile.read()
+
+
+@lru_cache(maxsize=None)
+def is_kroki_available() -> bool:
+    """
+    Returns True iff the local kroki instance accepts connections.
+    A plain TCP connect is all we need to know whether the container is up; it avoids a full HTTP round trip.
+    Cached with lru_cache so the probe happens at most once per test session, no matter how many tests ask.
+    """
+    try:
+        with socket.create_connection((KROKI_HOST, KROKI_PORT), timeout=1):
+            return True
+    except OSError:
+        return False
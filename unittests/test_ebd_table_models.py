@@ -170,6 +170,18 @@ dem Wert „Marktlokations-ID“ angegeben?""",
         assert isinstance(sub_row, EbdTableSubRow)
         assert sub_row.result_code == "AC7"
 
+    def test_models_are_slotted(self):
+        """
+        The model classes are slotted so that parsing thousands of rows doesn't allocate a ``__dict__`` per instance.
+        """
+        sub_row = EbdTableSubRow(
+            check_result=EbdCheckResult(result=True, subsequent_step_number=None),
+            result_code="A01",
+            note=None,
+        )
+        assert not hasattr(sub_row, "__dict__")
+        assert not hasattr(sub_row.check_result, "__dict__")
+
     def test_collect_answer_codes_instruction(self):
         snippet_from_e0453 = EbdTable(
             metadata=EbdTableMetaData(
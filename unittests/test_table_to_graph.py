@@ -23,6 +23,7 @@ from rebdhuhn.models.ebd_graph import (
 )
 from rebdhuhn.models.ebd_table import EbdTable
 from rebdhuhn.models.errors import GraphTooComplexForPlantumlError
+from unittests.conftest import is_kroki_available, read_kroki_response_mock
 from unittests.examples import table_e0003, table_e0015, table_e0025, table_e0401
 
 
@@ -151,6 +152,8 @@ class TestEbdTableModels:
         Test the conversion pipeline. The results are stored in `unittests/output` for you to inspect the result
         manually. The test only checks if the svg can be built.
         """
+        if not is_kroki_available():
+            pytest.skip("Requires the local kroki instance (docker compose up)")
         ebd_graph = convert_table_to_graph(table)
         assert str(ebd_graph.graph) == expected_description
 
@@ -265,12 +268,7 @@ class TestEbdTableModels:
         """
         ebd_graph = convert_table_to_graph(table)
         assert str(ebd_graph.graph) == expected_description
-        with open(
-            Path(__file__).parent / "test_files" / f"{ebd_graph.metadata.ebd_code}_kroki_response.dot.svg",
-            "r",
-            encoding="utf-8",
-        ) as infile:
-            kroki_response_string: str = infile.read()
+        kroki_response_string = read_kroki_response_mock(f"{ebd_graph.metadata.ebd_code}_kroki_response.dot.svg")
         requests_mock.post("http://localhost:8125/", text=kroki_response_string)
         self.create_and_save_svg_test(ebd_graph)
 
@@ -354,10 +352,7 @@ class TestEbdTableModels:
         `unittests/output` for you to inspect the result manually.
         This test uses a mock to avoid the request to kroki. The mock is stored in `test_files`.
         """
-        with open(
-            Path(__file__).parent / "test_files" / "E_0003_kroki_response.dot.svg", "r", encoding="utf-8"
-        ) as infile:
-            kroki_response_string: str = infile.read()
+        kroki_response_string = read_kroki_response_mock("E_0003_kroki_response.dot.svg")
         requests_mock.post("http://localhost:8125/", text=kroki_response_string)
         self.create_and_save_watermark_and_background_svg(add_background)
 
@@ -367,10 +362,7 @@ class TestEbdTableModels:
         `unittests/output` for you to inspect the result manually.
         This test uses a mock to avoid the request to kroki. The mock is stored in `test_files`.
         """
-        with open(
-            Path(__file__).parent / "test_files" / "E_0003_kroki_response.dot.svg", "r", encoding="utf-8"
-        ) as infile:
-            kroki_response_string: str = infile.read()
+        kroki_response_string = read_kroki_response_mock("E_0003_kroki_response.dot.svg")
         requests_mock.post("http://localhost:8125/", text=kroki_response_string)
         ebd_graph = convert_table_to_graph(table_e0003)
         dot_code = convert_graph_to_dot(ebd_graph)